@@ -264,6 +264,8 @@ class SettingsStore:
     def __post_init__(self) -> None:
         self._lock = threading.Lock()
         self._settings = self._load_or_init()
+        # Monotonic change counter; lets callers cache derived views cheaply.
+        self._version = 0
 
     def _load_or_init(self) -> AppSettings:
         # Start from env defaults so existing .env workflows keep working.
@@ -357,11 +359,17 @@ class SettingsStore:
         with self._lock:
             return AppSettings.model_validate(self._settings.model_dump())
 
+    def version(self) -> int:
+        """Counter bumped on every update(); cache invalidation key for callers."""
+        with self._lock:
+            return self._version
+
     def update(self, patch: dict[str, Any]) -> AppSettings:
         with self._lock:
             merged = _deep_merge(self._settings.model_dump(), patch)
             settings = _normalize_settings(AppSettings.model_validate(merged))
             self._settings = settings
+            self._version += 1
             _atomic_write_json(self.path, settings.model_dump())
             # Return a detached copy while still under lock; calling self.get()
             # here would attempt to re-acquire the same non-reentrant lock.
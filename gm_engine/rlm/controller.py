@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, Protocol
 
 from gm_engine.app.settings import AppSettings
@@ -19,6 +20,66 @@ class LLMProvider(Protocol):
     async def complete(self, *, system: str, user: str, temperature: float = 0.2) -> str: ...
 
 
+try:  # Optional fast path; core deps stay stdlib-only.
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode("utf-8")
+except ModuleNotFoundError:  # pragma: no cover
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=True, separators=(",", ":"), default=str)
+
+
+# First sentence boundary for splitting the resolve response into an
+# immediate chunk plus followups.
+_SENTENCE_BOUNDARY_RE = re.compile(r"[.!?…。！？]\s")
+
+# {{ name }} placeholders in prompt templates.
+_TEMPLATE_RE = re.compile(r"\{\{\s*([a-zA-Z0-9_]+)\s*\}\}")
+
+# Strong non-Latin script signal (Cyrillic, Arabic, Devanagari, CJK, Kana, Hangul).
+_NON_LATIN_RE = re.compile(r"[Ѐ-ӿ؀-ۿऀ-ॿ一-鿿぀-ヿ가-힯]")
+_WORD_RE = re.compile(r"[a-zA-Z']+")
+_COMMON_ENGLISH_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "you",
+        "your",
+        "are",
+        "is",
+        "to",
+        "of",
+        "in",
+        "with",
+        "for",
+        "what",
+        "next",
+        "start",
+        "roll",
+        "check",
+    }
+)
+
+
+class _DefaultingVars(dict):
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(template: str) -> str:
+    """Convert a `{{ name }}` template to `str.format`-style, escaping literal braces.
+
+    The result renders via `str.format_map` in a single C-level pass instead of a
+    Python callback per placeholder.
+    """
+    escaped = template.replace("{", "{{").replace("}", "}}")
+    # After escaping, original placeholders look like {{{{ name }}}}.
+    return re.sub(r"\{\{\{\{\s*([a-zA-Z0-9_]+)\s*\}\}\}\}", r"{\1}", escaped)
+
+
 @dataclass
 class RLMController:
     """Recursive Language Model controller.
@@ -36,18 +97,33 @@ class RLMController:
     budget: Budget = Budget()
     settings_store: SettingsStore | None = None
 
+    def __post_init__(self) -> None:
+        # Bounded queue + single worker for post-turn work; created lazily because
+        # the controller may be constructed before an event loop is running.
+        self._bg_queue: asyncio.Queue[tuple[TurnContext, NarrationPlan]] | None = None
+        self._bg_worker_task: asyncio.Task | None = None
+
     def _settings(self) -> AppSettings:
         if self.settings_store is None:
             return AppSettings()
         return self.settings_store.get()
 
-    def _render(self, template: str, vars: dict[str, str]) -> str:
-        pat = re.compile(r"{{\s*([a-zA-Z0-9_]+)\s*}}")
-
-        def repl(m: re.Match[str]) -> str:
-            return vars.get(m.group(1), "")
+    def _voice_profile_for(self, settings: AppSettings, player_id: str):
+        """O(1) player-profile lookup, cached until the settings store changes."""
+        version = self.settings_store.version() if self.settings_store is not None else 0
+        cached: tuple[int, dict[str, Any]] | None = getattr(self, "_profiles_cache", None)
+        if cached is None or cached[0] != version:
+            by_pid: dict[str, Any] = {}
+            for p in list(getattr(settings.voice, "player_profiles", []) or []):
+                pid = str(getattr(p, "player_id", "") or "").strip()
+                if pid and pid not in by_pid:
+                    by_pid[pid] = p
+            cached = (version, by_pid)
+            self._profiles_cache = cached
+        return cached[1].get(str(player_id or "").strip())
 
-        return pat.sub(repl, template)
+    def _render(self, template: str, vars: dict[str, str]) -> str:
+        return _compile_template(template).format_map(_DefaultingVars(vars))
 
     def _format_memory(self, state_view: dict[str, Any], *, max_turns: int) -> str:
         entries = state_view.get("interaction_log") or []
@@ -74,61 +150,51 @@ class RLMController:
             else:
                 # Unknown entry kind; keep compact JSON.
                 try:
-                    lines.append(json.dumps(e, ensure_ascii=True, separators=(",", ":")))
+                    lines.append(_json_dumps(e))
                 except Exception:
                     pass
         return "\n".join(lines).strip()
 
-    def _format_snippets(self, knowledge_hits: list[dict], *, max_snippets: int = 3) -> str:
-        out: list[str] = []
-        for h in knowledge_hits[:max_snippets]:
-            meta = h.get("meta") if isinstance(h, dict) else None
-            meta = meta if isinstance(meta, dict) else {}
-            doc_id = meta.get("doc_id") or ""
-            doc_kind = meta.get("doc_kind") or ""
-            ruleset = meta.get("ruleset") or ""
-            page = meta.get("page") or ""
-            ctype = meta.get("type") or ""
-            hdr = " ".join(
-                p
-                for p in [
-                    str(doc_id),
-                    str(doc_kind) if doc_kind else "",
-                    str(ruleset) if ruleset else "",
-                    f"p{page}" if page else "",
-                    str(ctype),
-                ]
-                if p
-            ).strip()
-            hdr = f"[{hdr}]" if hdr else "[knowledge]"
-            txt = str(h.get("text") or "").strip() if isinstance(h, dict) else ""
-            if not txt:
-                continue
-            out.append(f"{hdr}\n{txt}")
-        return ("\n\n".join(out)).strip()
-
-    def _knowledge_sources(self, knowledge_hits: list[dict], *, max_sources: int = 5) -> list[str]:
-        out: list[str] = []
+    def _format_knowledge(
+        self, knowledge_hits: list[dict], *, max_snippets: int = 3, max_sources: int = 5
+    ) -> tuple[str, list[str]]:
+        """Single pass over hits producing (prompt snippets, deduped source labels)."""
+        snippets: list[str] = []
+        sources: list[str] = []
         seen: set[str] = set()
-        for h in knowledge_hits:
+        for i, h in enumerate(knowledge_hits):
             if not isinstance(h, dict):
                 continue
             meta = h.get("meta") if isinstance(h.get("meta"), dict) else {}
-            doc_id = str(meta.get("doc_id") or "").strip() or "unknown_doc"
+            doc_id = str(meta.get("doc_id") or "").strip()
             page = str(meta.get("page") or "").strip()
             ctype = str(meta.get("type") or "").strip()
-            src = doc_id
-            if page:
-                src += f" p{page}"
-            if ctype:
-                src += f" {ctype}"
-            if src in seen:
-                continue
-            seen.add(src)
-            out.append(src)
-            if len(out) >= max_sources:
+
+            if i < max_snippets:
+                doc_kind = str(meta.get("doc_kind") or "").strip()
+                ruleset = str(meta.get("ruleset") or "").strip()
+                hdr = " ".join(
+                    p
+                    for p in [doc_id, doc_kind, ruleset, f"p{page}" if page else "", ctype]
+                    if p
+                ).strip()
+                hdr = f"[{hdr}]" if hdr else "[knowledge]"
+                txt = str(h.get("text") or "").strip()
+                if txt:
+                    snippets.append(f"{hdr}\n{txt}")
+
+            if len(sources) < max_sources:
+                src = doc_id or "unknown_doc"
+                if page:
+                    src += f" p{page}"
+                if ctype:
+                    src += f" {ctype}"
+                if src not in seen:
+                    seen.add(src)
+                    sources.append(src)
+            elif i >= max_snippets:
                 break
-        return out
+        return ("\n\n".join(snippets)).strip(), sources
 
     def _lang_base(self, tag: str | None) -> str:
         s = str(tag or "").strip().replace("_", "-").lower()
@@ -137,66 +203,40 @@ class RLMController:
         return s.split("-", 1)[0]
 
     def _looks_englishish(self, text: str) -> bool:
-        t = str(text or "").strip()
-        if not t:
+        # The heuristic is just as valid on a prefix; don't scan huge transcripts.
+        t = str(text or "")[:1024].strip()
+        if len(t) < 4:
             return False
         low = t.lower()
+        # ASCII input cannot contain non-Latin scripts; skip the range scan entirely.
         # Strong non-Latin signal => not English.
-        if any(
-            ("\u0400" <= ch <= "\u04ff")
-            or ("\u0600" <= ch <= "\u06ff")
-            or ("\u0900" <= ch <= "\u097f")
-            or ("\u4e00" <= ch <= "\u9fff")
-            or ("\u3040" <= ch <= "\u30ff")
-            or ("\uac00" <= ch <= "\ud7af")
-            for ch in low
-        ):
+        if not low.isascii() and _NON_LATIN_RE.search(low):
             return False
-        words = re.findall(r"[a-zA-Z']+", low)
+        words = _WORD_RE.findall(low)
         if not words:
             return False
-        common = {
-            "the",
-            "and",
-            "you",
-            "your",
-            "are",
-            "is",
-            "to",
-            "of",
-            "in",
-            "with",
-            "for",
-            "what",
-            "next",
-            "start",
-            "roll",
-            "check",
-        }
-        hits = sum(1 for w in words if w in common)
+        hits = sum(1 for w in words if w in _COMMON_ENGLISH_WORDS)
         return hits >= 2 or (hits >= 1 and len(words) >= 6)
 
     async def handle_turn(self, ctx: TurnContext) -> NarrationPlan:
         started = time.perf_counter()
         self.logger.turn_started(ctx)
 
+        # Settings are read once per turn and threaded through the step methods.
+        settings = self._settings()
+
         # Dev convenience: ensure campaign row exists before any FK-backed writes.
         await self.state.ensure_campaign(ctx)
         # Keep player registry in DB in sync with campaign setup/player turns.
         try:
-            s = self._settings()
             display_name = ctx.player_id
             voice_profile = ""
-            for p in list(getattr(s.voice, "player_profiles", []) or []):
-                pid = str(getattr(p, "player_id", "") or "").strip()
-                if pid != str(ctx.player_id or "").strip():
-                    continue
-                dn = str(getattr(p, "display_name", "") or "").strip()
-                vp = str(getattr(p, "voice_profile", "") or "").strip()
+            prof = self._voice_profile_for(settings, ctx.player_id)
+            if prof is not None:
+                dn = str(getattr(prof, "display_name", "") or "").strip()
                 if dn:
                     display_name = dn
-                voice_profile = vp
-                break
+                voice_profile = str(getattr(prof, "voice_profile", "") or "").strip()
             await self.state.ensure_player_profile(
                 ctx,
                 display_name=display_name,
@@ -207,44 +247,53 @@ class RLMController:
             pass
 
         # Depth-0 reasoning: interpret intent and decide required reads.
-        plan = await self._rlm_step(ctx, depth=0, llm_calls=0)
+        plan = await self._rlm_step(ctx, depth=0, llm_calls=0, settings=settings)
 
         # Always append a minimal interaction log entry (DB is the continuity spine).
-        plan = NarrationPlan(
-            immediate_text=plan.immediate_text,
-            followups=plan.followups,
-            writes=list(plan.writes)
-            + [
-                StateWriteSpec(
-                    kind="append_log",
-                    params={
-                        "entry": {
-                            "kind": "turn",
-                            "campaign_id": ctx.campaign_id,
-                            "session_id": ctx.session_id,
-                            "turn_id": ctx.turn_id,
-                            "player_id": ctx.player_id,
-                            "locale": ctx.locale,
-                            "player_text": ctx.transcript_text,
-                            "gm_text": plan.immediate_text,
-                            "followups": plan.followups,
-                        }
-                    },
-                )
-            ],
-            delayed_events=plan.delayed_events,
-            debug=plan.debug,
+        log_entry = {
+            "kind": "turn",
+            "campaign_id": ctx.campaign_id,
+            "session_id": ctx.session_id,
+            "turn_id": ctx.turn_id,
+            "player_id": ctx.player_id,
+            "locale": ctx.locale,
+            "player_text": ctx.transcript_text,
+            "gm_text": plan.immediate_text,
+            "followups": plan.followups,
+        }
+        plan = replace(
+            plan,
+            writes=[*plan.writes, StateWriteSpec(kind="append_log", params={"entry": log_entry})],
         )
 
         # Commit state writes (transaction) BEFORE narration so reality is consistent.
         await self.state.apply_writes(ctx, plan.writes)
 
-        # Fire-and-forget background tasks (never block narration).
-        asyncio.create_task(self._background_post_turn(ctx, plan))
+        # Fire-and-forget background work (never blocks narration). Bounded queue
+        # with a single worker so a burst of turns cannot spawn unbounded tasks.
+        self._enqueue_post_turn(ctx, plan)
 
         self.logger.turn_finished(ctx, latency_ms=int((time.perf_counter() - started) * 1000))
         return plan
 
+    def _enqueue_post_turn(self, ctx: TurnContext, plan: NarrationPlan) -> None:
+        if self._bg_queue is None:
+            self._bg_queue = asyncio.Queue(maxsize=256)
+            self._bg_worker_task = asyncio.create_task(self._bg_worker())
+        try:
+            self._bg_queue.put_nowait((ctx, plan))
+        except asyncio.QueueFull:
+            self.logger.error(ctx, "background_queue_full", {"turn_id": ctx.turn_id})
+
+    async def _bg_worker(self) -> None:
+        assert self._bg_queue is not None
+        while True:
+            ctx, plan = await self._bg_queue.get()
+            try:
+                await self._background_post_turn(ctx, plan)
+            finally:
+                self._bg_queue.task_done()
+
     async def _background_post_turn(self, ctx: TurnContext, plan: NarrationPlan) -> None:
         try:
             self.logger.append_narration(ctx, plan)
@@ -253,8 +302,9 @@ class RLMController:
         except Exception as e:  # pragma: no cover
             self.logger.error(ctx, "background_post_turn_failed", {"error": str(e)})
 
-    async def _rlm_step(self, ctx: TurnContext, *, depth: int, llm_calls: int) -> NarrationPlan:
-        settings = self._settings()
+    async def _rlm_step(
+        self, ctx: TurnContext, *, depth: int, llm_calls: int, settings: AppSettings
+    ) -> NarrationPlan:
         if depth > self.budget.max_depth:
             self.logger.error(ctx, "max_depth_exceeded", {"depth": depth})
             return NarrationPlan(
@@ -265,29 +315,72 @@ class RLMController:
                 debug={"depth": depth, "reason": "max_depth_exceeded"},
             )
 
-        # 1) Interpret intent (fast). If uncertain, use one LLM call to classify.
-        intent = await self._interpret_intent(ctx, llm_calls)
-        llm_calls = intent.llm_calls_used
+        # 1) Kick off the deterministic default reads eagerly so DB latency overlaps
+        #    with intent classification (which may spend an LLM call on short utterances).
+        default_reads = [StateReadSpec(kind="campaign_snapshot", params={})]
+        if settings.prompts.include_memory and settings.prompts.memory_turns > 0:
+            default_reads.append(
+                StateReadSpec(kind="interaction_log", params={"limit": int(settings.prompts.memory_turns)})
+            )
+        state_reads_task = asyncio.create_task(self.state.read(ctx, default_reads))
 
-        # 2) Decide what knowledge/state is required.
-        reads, retrievals = intent.state_reads, intent.retrievals
+        # 2) Interpret intent (fast). If uncertain, use one LLM call to classify.
+        intent, state_view = await asyncio.gather(
+            self._interpret_intent(ctx, llm_calls, settings=settings), state_reads_task
+        )
+        llm_calls = intent.llm_calls_used
+        retrievals = intent.retrievals
 
-        # 3) Perform reads (bounded).
-        state_view = await self.state.read(ctx, reads)
+        # 3) Supplemental reads the intent requested beyond the speculative defaults.
+        default_kinds = {r.kind for r in default_reads}
+        extra_reads = [r for r in intent.state_reads if r.kind not in default_kinds]
+        if extra_reads:
+            state_view.update(await self.state.read(ctx, extra_reads))
 
-        knowledge_hits = []
+        knowledge_hits: list[dict] = []
         if retrievals and self.budget.max_qdrant_queries_per_turn > 0:
-            for spec in retrievals[: self.budget.max_qdrant_queries_per_turn]:
-                knowledge_hits.extend(await self.knowledge.search(ctx, spec))
+            # Issue the bounded retrievals concurrently; wall clock drops from the
+            # sum of the query latencies to the slowest one.
+            results = await asyncio.gather(
+                *(
+                    self.knowledge.search(ctx, spec)
+                    for spec in retrievals[: self.budget.max_qdrant_queries_per_turn]
+                ),
+                return_exceptions=True,
+            )
+            for r in results:
+                if isinstance(r, BaseException):
+                    self.logger.error(ctx, "knowledge_search_failed", {"error": str(r)})
+                    continue
+                knowledge_hits.extend(r)
+            # Parallel retrievals can return overlapping chunks; dedupe once here so
+            # snippet formatting and source listing don't re-pay for duplicates and
+            # redundant snippets don't eat the prompt budget.
+            if len(knowledge_hits) > 1:
+                seen_keys: set[tuple] = set()
+                deduped: list[dict] = []
+                for h in knowledge_hits:
+                    meta = h.get("meta") if isinstance(h, dict) else None
+                    meta = meta if isinstance(meta, dict) else {}
+                    text = str(h.get("text") or "") if isinstance(h, dict) else ""
+                    key = (meta.get("doc_id"), meta.get("page"), hash(text))
+                    if key in seen_keys:
+                        continue
+                    seen_keys.add(key)
+                    deduped.append(h)
+                knowledge_hits = deduped
+
+        # Single traversal for both the prompt snippets and the debug source list.
+        snippets, knowledge_sources = self._format_knowledge(knowledge_hits)
 
         # 4) Resolve immediate consequences.
-        resolution = await self._resolve(ctx, state_view, knowledge_hits, llm_calls)
+        resolution = await self._resolve(ctx, state_view, snippets, llm_calls, settings=settings)
         llm_calls = resolution.llm_calls_used
 
         # 5) Detect unresolved effects; recurse if needed.
         if resolution.needs_followup and depth < self.budget.max_depth:
             self.logger.event(ctx, "rlm_recurse", {"depth": depth + 1, "reason": resolution.recurse_reason})
-            follow = await self._rlm_step(ctx, depth=depth + 1, llm_calls=llm_calls)
+            follow = await self._rlm_step(ctx, depth=depth + 1, llm_calls=llm_calls, settings=settings)
             # Merge: immediate narration stays, followups appended.
             return NarrationPlan(
                 immediate_text=resolution.immediate_text,
@@ -299,7 +392,7 @@ class RLMController:
                     "knowledge_enabled": bool(settings.knowledge.enabled),
                     "retrieval_queries": len(retrievals),
                     "knowledge_hits": len(knowledge_hits),
-                    "knowledge_sources": self._knowledge_sources(knowledge_hits, max_sources=5),
+                    "knowledge_sources": knowledge_sources,
                     "response_language_mode": str(settings.prompts.response_language_mode or "player"),
                     "response_language_tag": str(ctx.locale or ""),
                     "followup": follow.debug or {},
@@ -317,7 +410,7 @@ class RLMController:
                 "knowledge_enabled": bool(settings.knowledge.enabled),
                 "retrieval_queries": len(retrievals),
                 "knowledge_hits": len(knowledge_hits),
-                "knowledge_sources": self._knowledge_sources(knowledge_hits, max_sources=5),
+                "knowledge_sources": knowledge_sources,
                 "response_language_mode": str(settings.prompts.response_language_mode or "player"),
                 "response_language_tag": str(ctx.locale or ""),
             },
@@ -325,14 +418,14 @@ class RLMController:
 
     # -------------------- reasoning primitives --------------------
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class _Intent:
         kind: str
         state_reads: list[StateReadSpec]
         retrievals: list[RetrievalSpec]
         llm_calls_used: int
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class _Resolution:
         immediate_text: str
         followups: list[str]
@@ -342,10 +435,13 @@ class RLMController:
         recurse_reason: str | None
         llm_calls_used: int
 
-    async def _interpret_intent(self, ctx: TurnContext, llm_calls: int) -> _Intent:
+    async def _interpret_intent(
+        self, ctx: TurnContext, llm_calls: int, *, settings: AppSettings
+    ) -> _Intent:
         # Deterministic fast path: minimal heuristic intent extraction.
-        s = self._settings()
-        text = ctx.transcript_text.strip().lower()
+        # Keyword heuristics only need a prefix; long paste-ins scan the same.
+        s = settings
+        text = ctx.transcript_text[:512].strip().lower()
         reads = [StateReadSpec(kind="campaign_snapshot", params={})]
         if s.prompts.include_memory and s.prompts.memory_turns > 0:
             reads.append(StateReadSpec(kind="interaction_log", params={"limit": int(s.prompts.memory_turns)}))
@@ -421,9 +517,17 @@ class RLMController:
 
         return self._Intent(kind=kind, state_reads=reads, retrievals=retrievals, llm_calls_used=llm_calls)
 
-    async def _resolve(self, ctx: TurnContext, state_view: dict, knowledge_hits: list[dict], llm_calls: int) -> _Resolution:
+    async def _resolve(
+        self,
+        ctx: TurnContext,
+        state_view: dict,
+        snippets: str,
+        llm_calls: int,
+        *,
+        settings: AppSettings,
+    ) -> _Resolution:
         # Prefer deterministic templates; use LLM only when needed.
-        s = self._settings()
+        s = settings
 
         if llm_calls < self.budget.max_llm_calls_per_turn:
             self.logger.event(ctx, "llm_call", {"phase": "resolve"})
@@ -433,12 +537,11 @@ class RLMController:
             if not memory:
                 memory = "(empty)"
 
-            snippets = self._format_snippets(knowledge_hits, max_snippets=3)
             if not snippets:
                 snippets = "(none)"
 
             try:
-                state_json = json.dumps(state_view, ensure_ascii=True)
+                state_json = _json_dumps(state_view)
             except Exception:
                 state_json = "{}"
 
@@ -479,21 +582,30 @@ class RLMController:
                     "Use the provided knowledge snippets as the source of truth for rules/lore. "
                     "When applying a rule, cite the snippet header briefly (for example: [doc_id p12])."
                 )
-            user = (
-                f"Detected player language tag: {detected_lang or 'unknown'}\n\n"
-                + user
-            )
-            system_prompt = (
-                f"{s.prompts.resolve_system}\n\nLanguage policy: {language_policy}"
-                + (f"\n\nKnowledge policy: {kb_policy}" if kb_policy else "")
+            user = "".join(
+                ("Detected player language tag: ", detected_lang or "unknown", "\n\n", user)
             )
+            system_parts = [s.prompts.resolve_system, "\n\nLanguage policy: ", language_policy]
+            if kb_policy:
+                system_parts += ("\n\nKnowledge policy: ", kb_policy)
+            system_prompt = "".join(system_parts)
+            followups: list[str] = []
             out = await self.llm.complete(
                 system=system_prompt,
                 user=user,
                 temperature=0.2,
             )
-            llm_calls += 1
+            # Peel off the first sentence so TTS synthesizes a short immediate
+            # chunk first; the remainder rides along in followups (already
+            # supported downstream).
             immediate = out.strip()
+            m = _SENTENCE_BOUNDARY_RE.search(immediate)
+            if m:
+                rest = immediate[m.end() :].strip()
+                immediate = immediate[: m.end()].strip()
+                if rest:
+                    followups.append(rest)
+            llm_calls += 1
 
             # Safety net: if target is non-English but the draft output is English-ish,
             # run a translation post-pass so players hear GM in their language.
@@ -510,10 +622,11 @@ class RLMController:
                         "Translate the GM response into the target language only. "
                         "Keep it concise and preserve game meaning."
                     )
+                    draft = "\n".join([immediate, *followups]).strip()
                     trans_user = (
                         f"Target language tag: {target_lang}\n\n"
                         f"Player original utterance:\n{ctx.transcript_text}\n\n"
-                        f"GM draft response:\n{immediate}\n\n"
+                        f"GM draft response:\n{draft}\n\n"
                         "Return only the translated GM response."
                     )
                     translated = await self.llm.complete(
@@ -525,12 +638,14 @@ class RLMController:
                     tr = str(translated or "").strip()
                     if tr:
                         immediate = tr
+                        followups = []
         else:
             immediate = "Understood. Describe exactly what you do, and I’ll resolve the consequences."
+            followups = []
 
         return self._Resolution(
             immediate_text=immediate,
-            followups=[],
+            followups=followups,
             writes=[],
             delayed_events=[],
             needs_followup=False,
@@ -21,7 +21,7 @@ ChunkType = Literal[
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Budget:
     max_depth: int = 2
     max_llm_calls_per_turn: int = 3
@@ -30,7 +30,7 @@ class Budget:
     max_sql_writes_per_turn: int = 20
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TurnContext:
     campaign_id: str
     session_id: str
@@ -40,26 +40,26 @@ class TurnContext:
     locale: str = "en-US"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetrievalSpec:
     query: str
     top_k: int = 5
     filters: dict[str, Any] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateReadSpec:
     kind: str
     params: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateWriteSpec:
     kind: str
     params: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NarrationPlan:
     # First chunk must be produced fast to start streaming TTS.
     immediate_text: str
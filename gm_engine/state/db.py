@@ -1,11 +1,54 @@
 from __future__ import annotations
 
-from typing import AsyncGenerator
+import json
+from functools import lru_cache
+from typing import Any, AsyncGenerator
 from pathlib import Path
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 
+# Issued once per new SQLite connection. WAL lets readers proceed while a write
+# is in flight (turn commits vs. snapshot/memory reads), and synchronous=NORMAL
+# halves fsyncs while staying durable enough for a WAL database.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+# Compact encoding for all JSON columns: smaller rows (more per b-tree page)
+# and cheaper re-parse. Stays TEXT so json_extract() filters/indexes keep
+# working — a binary format (msgpack/JSONB) would break those, and SQLite's
+# JSONB needs 3.45+ which we cannot assume.
+try:  # Optional fast path; core deps stay stdlib-only.
+    import orjson
+
+    def _json_serializer(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def _json_deserializer(s: str | bytes) -> Any:
+        return orjson.loads(s)
+except ModuleNotFoundError:  # pragma: no cover
+
+    def _json_serializer(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    _json_deserializer = json.loads
+
+
+def _on_connect(dbapi_conn, _record) -> None:
+    cursor = dbapi_conn.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
 class DB:
     def __init__(self, db_path: Path | str):
         self.db_path = Path(db_path)
@@ -15,7 +58,19 @@ class DB:
 
     def engine(self) -> AsyncEngine:
         if self._engine is None:
-            self._engine = create_async_engine(self.url, future=True)
+            # One hot primary connection plus a little overflow: SQLite wants a
+            # single writer, while WAL still lets overflow readers proceed.
+            self._engine = create_async_engine(
+                self.url,
+                future=True,
+                pool_size=1,
+                max_overflow=4,
+                pool_recycle=3600,
+                connect_args={"timeout": 30},
+                json_serializer=_json_serializer,
+                json_deserializer=_json_deserializer,
+            )
+            event.listens_for(self._engine.sync_engine, "connect")(_on_connect)
         return self._engine
 
     def sessionmaker(self):
@@ -29,5 +84,12 @@ class DB:
             yield sess
 
 
+@lru_cache(maxsize=8)
+def _db_for_path(path_str: str) -> DB:
+    return DB(path_str)
+
+
 def make_db(db_path: Path | str) -> DB:
-    return DB(db_path)
+    # Repeated make_db calls for the same file share one DB (and so one engine
+    # and sessionmaker) instead of tearing pools up and down.
+    return _db_for_path(str(Path(db_path)))
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
@@ -21,7 +22,11 @@ class Base(DeclarativeBase):
 
 
 def gen_uuid() -> str:
-    return str(uuid4())
+    # Ids stay TEXT uuid strings rather than 16-byte blobs: campaign ids are
+    # user-chosen slugs (e.g. "demo") that FK columns must match, and the
+    # alembic baseline (0001_initial) ships these columns as String(36).
+    # .hex skips the dashed formatting (32 chars, still unique and opaque).
+    return uuid4().hex
 
 
 def _created_at() -> Column[DateTime]:
@@ -43,6 +48,11 @@ class Campaign(Base):
     updated_at = _updated_at()
 
 
+# NOTE: campaign relationships below use lazy="raise" so an accidental
+# `.campaign` access in a hot read loop fails loud instead of silently issuing
+# an N+1 SELECT per row; opt in with selectinload() where the join is wanted.
+
+
 class Player(Base):
     __tablename__ = "players"
 
@@ -53,7 +63,7 @@ class Player(Base):
     created_at = _created_at()
     updated_at = _updated_at()
 
-    campaign = relationship("Campaign")
+    campaign = relationship("Campaign", lazy="raise")
 
 
 class Character(Base):
@@ -66,7 +76,7 @@ class Character(Base):
     created_at = _created_at()
     updated_at = _updated_at()
 
-    campaign = relationship("Campaign")
+    campaign = relationship("Campaign", lazy="raise")
 
 
 class NPC(Base):
@@ -79,7 +89,7 @@ class NPC(Base):
     created_at = _created_at()
     updated_at = _updated_at()
 
-    campaign = relationship("Campaign")
+    campaign = relationship("Campaign", lazy="raise")
 
 
 class Location(Base):
@@ -93,7 +103,7 @@ class Location(Base):
     created_at = _created_at()
     updated_at = _updated_at()
 
-    campaign = relationship("Campaign")
+    campaign = relationship("Campaign", lazy="raise")
 
 
 class Quest(Base):
@@ -107,7 +117,7 @@ class Quest(Base):
     created_at = _created_at()
     updated_at = _updated_at()
 
-    campaign = relationship("Campaign")
+    campaign = relationship("Campaign", lazy="raise")
 
 
 class Faction(Base):
@@ -120,7 +130,7 @@ class Faction(Base):
     created_at = _created_at()
     updated_at = _updated_at()
 
-    campaign = relationship("Campaign")
+    campaign = relationship("Campaign", lazy="raise")
 
 
 class InventoryItem(Base):
@@ -135,7 +145,7 @@ class InventoryItem(Base):
     created_at = _created_at()
     updated_at = _updated_at()
 
-    campaign = relationship("Campaign")
+    campaign = relationship("Campaign", lazy="raise")
 
 
 class TimelineEvent(Base):
@@ -143,12 +153,15 @@ class TimelineEvent(Base):
 
     id = Column(String(36), primary_key=True, default=gen_uuid)
     campaign_id = Column(String(36), ForeignKey("campaigns.id"), nullable=False, index=True)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    # Keep the client-side default: databases created before the server
+    # default existed have no DDL-level fallback, so rows inserted through
+    # the bulk path would otherwise land as NULL there.
+    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
     data = Column(JSON, nullable=True)
     created_at = _created_at()
     updated_at = _updated_at()
 
-    campaign = relationship("Campaign")
+    campaign = relationship("Campaign", lazy="raise")
 
 
 class InteractionLog(Base):
@@ -159,7 +172,11 @@ class InteractionLog(Base):
     timestamp = Column(DateTime, server_default=func.now(), nullable=False)
     entry = Column(JSON, nullable=False)
 
-    campaign = relationship("Campaign")
+    # Covers `WHERE campaign_id = ? ORDER BY id DESC LIMIT k` (memory reads,
+    # latest_campaign_id) as a bounded index walk instead of scan+sort.
+    __table_args__ = (Index("ix_interaction_log_campaign_id_desc", campaign_id, id.desc()),)
+
+    campaign = relationship("Campaign", lazy="raise")
 
 
 class DelayedEvent(Base):
@@ -175,4 +192,7 @@ class DelayedEvent(Base):
     created_at = _created_at()
     updated_at = _updated_at()
 
-    campaign = relationship("Campaign")
+    # Due-order polling per campaign.
+    __table_args__ = (Index("ix_delayed_events_campaign_due", campaign_id, due_at),)
+
+    campaign = relationship("Campaign", lazy="raise")
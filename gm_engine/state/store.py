@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+import time
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, lambda_stmt, select, text
 from sqlalchemy import func
 
 from gm_engine.rlm.types import StateReadSpec, StateWriteSpec, TurnContext
@@ -28,6 +29,9 @@ class WorldStateStore:
     def __post_init__(self) -> None:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._db = make_db(self.db_path)
+        # Bind the session factory once; sessions then draw long-lived pooled
+        # connections (hot SQLite page cache) instead of per-call setup.
+        self._sessionmaker = self._db.sessionmaker()
         self._schema_ready = False
         self._schema_lock = asyncio.Lock()
 
@@ -40,12 +44,57 @@ class WorldStateStore:
             engine = self._db.engine()
             async with engine.begin() as conn:
                 await conn.run_sync(models.Base.metadata.create_all)
+                # Expression indexes backing the json_extract() filters used by
+                # interaction_log reads/deletes (not expressible via Column index=True).
+                await conn.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS ix_interaction_log_session ON interaction_log "
+                        "(campaign_id, json_extract(entry, '$.session_id'))"
+                    )
+                )
+                await conn.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS ix_interaction_log_player ON interaction_log "
+                        "(campaign_id, json_extract(entry, '$.player_id'))"
+                    )
+                )
+                await conn.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS ix_players_pid ON players "
+                        "(campaign_id, json_extract(data, '$.player_id'))"
+                    )
+                )
+                # Composite indexes declared on the models only materialize via
+                # create_all for brand-new tables; emit them here too so
+                # databases created by the pre-index schema pick them up.
+                await conn.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS ix_interaction_log_campaign_id_desc "
+                        "ON interaction_log (campaign_id, id DESC)"
+                    )
+                )
+                await conn.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS ix_delayed_events_campaign_due "
+                        "ON delayed_events (campaign_id, due_at)"
+                    )
+                )
             self._schema_ready = True
 
+    async def startup(self) -> None:
+        """One-time process-start init; call before serving turns.
+
+        Warming the schema here turns the per-call guards below into a plain
+        attribute check with no await. Public methods keep the lazy fallback so
+        ad-hoc callers (scripts, shims) still work without a startup hook.
+        """
+        await self.ensure_schema()
+
     async def ensure_campaign(self, ctx: TurnContext, *, name: str | None = None) -> None:
         """Ensure a campaign row exists for this ctx (dev convenience)."""
-        await self.ensure_schema()
-        async with self._db.sessionmaker()() as sess:
+        if not self._schema_ready:
+            await self.ensure_schema()
+        async with self._sessionmaker() as sess:
             async with sess.begin():
                 row = await sess.get(models.Campaign, ctx.campaign_id)
                 if row is not None:
@@ -60,33 +109,43 @@ class WorldStateStore:
 
     async def list_player_profiles(self, campaign_id: str) -> list[dict[str, str]]:
         """Return player profiles stored for a campaign."""
-        await self.ensure_schema()
-        async with self._db.sessionmaker()() as sess:
-            q = (
-                select(models.Player)
-                .where(models.Player.campaign_id == campaign_id)
-                .order_by(models.Player.created_at.asc(), models.Player.id.asc())
+        if not self._schema_ready:
+            await self.ensure_schema()
+        async with self._sessionmaker() as sess:
+            # Project just the three profile fields and dedupe/cap in SQL, so
+            # neither full rows nor JSON blobs cross the driver for large casts.
+            q = lambda_stmt(
+                lambda: select(
+                    func.json_extract(models.Player.data, "$.player_id"),
+                    func.json_extract(models.Player.data, "$.display_name"),
+                    func.json_extract(models.Player.data, "$.voice_profile"),
+                    models.Player.name,
+                )
+                .where(
+                    models.Player.campaign_id == campaign_id,
+                    func.json_extract(models.Player.data, "$.player_id").is_not(None),
+                    func.json_extract(models.Player.data, "$.player_id") != "",
+                )
+                .group_by(func.json_extract(models.Player.data, "$.player_id"))
+                .order_by(
+                    func.min(models.Player.created_at).asc(),
+                    func.min(models.Player.id).asc(),
+                )
+                .limit(8)
             )
-            rows = (await sess.execute(q)).scalars().all()
+            rows = (await sess.execute(q)).all()
             out: list[dict[str, str]] = []
-            seen: set[str] = set()
-            for r in rows:
-                d = r.data if isinstance(r.data, dict) else {}
-                pid = str(d.get("player_id") or "").strip()
-                if not pid or pid in seen:
+            for pid, display, voice_profile, name in rows:
+                pid = str(pid or "").strip()
+                if not pid:
                     continue
-                seen.add(pid)
-                display = str(d.get("display_name") or r.name or pid).strip() or pid
-                voice_profile = str(d.get("voice_profile") or "").strip()
                 out.append(
                     {
                         "player_id": pid,
-                        "display_name": display,
-                        "voice_profile": voice_profile,
+                        "display_name": str(display or name or pid).strip() or pid,
+                        "voice_profile": str(voice_profile or "").strip(),
                     }
                 )
-                if len(out) >= 8:
-                    break
             return out
 
     async def upsert_player_profiles(self, campaign_id: str, profiles: list[dict[str, Any]]) -> int:
@@ -112,11 +171,20 @@ class WorldStateStore:
         if not cleaned:
             return 0
 
-        await self.ensure_schema()
-        now = datetime.now(timezone.utc).isoformat()
-        async with self._db.sessionmaker()() as sess:
+        if not self._schema_ready:
+            await self.ensure_schema()
+        # Epoch seconds: no per-batch datetime/isoformat work, smaller JSON blob.
+        now = int(time.time())
+        async with self._sessionmaker() as sess:
             async with sess.begin():
-                q = select(models.Player).where(models.Player.campaign_id == campaign_id)
+                # Fetch only the rows we are about to touch (indexed json_extract IN),
+                # not every player of the campaign.
+                q = select(models.Player).where(
+                    models.Player.campaign_id == campaign_id,
+                    func.json_extract(models.Player.data, "$.player_id").in_(
+                        [p["player_id"] for p in cleaned]
+                    ),
+                )
                 rows = (await sess.execute(q)).scalars().all()
                 by_pid: dict[str, models.Player] = {}
                 for r in rows:
@@ -144,12 +212,14 @@ class WorldStateStore:
                             )
                         )
                         continue
-                    d = row.data if isinstance(row.data, dict) else {}
+                    d = dict(row.data) if isinstance(row.data, dict) else {}
                     d["player_id"] = pid
                     d["display_name"] = display
                     d["voice_profile"] = voice_profile
                     d["last_seen_at"] = now
                     row.name = display
+                    # Assign a fresh dict: re-assigning the same object is invisible
+                    # to SQLAlchemy's change tracking and the update would be lost.
                     row.data = d
                     sess.add(row)
         return len(cleaned)
@@ -173,66 +243,90 @@ class WorldStateStore:
         )
 
     async def read(self, ctx: TurnContext, reads: list[StateReadSpec]) -> dict[str, Any]:
-        await self.ensure_schema()
+        if not self._schema_ready:
+            await self.ensure_schema()
         out: dict[str, Any] = {"campaign_id": ctx.campaign_id}
-        async with self._db.sessionmaker()() as sess:
-            for spec in reads:
-                kind = spec.kind
-                params = spec.params
-
-                if kind == "campaign_snapshot":
-                    q = select(models.Campaign).where(models.Campaign.id == ctx.campaign_id)
-                    row = (await sess.execute(q)).scalars().first()
-                    out["campaign"] = (
-                        {"id": row.id, "name": row.name, "meta": row.meta} if row is not None else None
-                    )
+        if not reads:
+            return out
+        # Specs are independent SELECTs; run them concurrently, each on its own
+        # pooled session, so multi-kind reads cost the slowest query, not the sum.
+        results = await asyncio.gather(*(self._read_one(ctx, spec) for spec in reads))
+        for key, value in results:
+            if key == "unknown_reads":
+                out.setdefault("unknown_reads", []).append(value)
+            else:
+                out[key] = value
+        return out
 
-                elif kind == "characters":
-                    limit = int(params.get("limit", 100))
-                    q = (
-                        select(models.Character)
-                        .where(models.Character.campaign_id == ctx.campaign_id)
-                        .limit(limit)
-                    )
-                    rows = (await sess.execute(q)).scalars().all()
-                    out["characters"] = [{"id": c.id, "name": c.name, "attrs": c.attrs} for c in rows]
-
-                elif kind == "interaction_log":
-                    limit = int(params.get("limit", 100))
-                    fetch_limit = max(limit * 5, 200)
-                    q = (
-                        select(models.InteractionLog)
-                        .where(models.InteractionLog.campaign_id == ctx.campaign_id)
-                        .order_by(models.InteractionLog.id.desc())
-                        .limit(fetch_limit)
+    async def _read_one(self, ctx: TurnContext, spec: StateReadSpec) -> tuple[str, Any]:
+        kind = spec.kind
+        params = spec.params
+        # lambda_stmt caches the constructed/compiled SELECT per lambda, so
+        # repeated reads skip statement building and only swap bind values.
+        cid = ctx.campaign_id
+        async with self._sessionmaker() as sess:
+            if kind == "campaign_snapshot":
+                q = lambda_stmt(lambda: select(models.Campaign).where(models.Campaign.id == cid))
+                row = (await sess.execute(q)).scalars().first()
+                return (
+                    "campaign",
+                    {"id": row.id, "name": row.name, "meta": row.meta} if row is not None else None,
+                )
+
+            if kind == "characters":
+                limit = int(params.get("limit", 100))
+                q = lambda_stmt(
+                    lambda: select(models.Character)
+                    .where(models.Character.campaign_id == cid)
+                    .limit(limit)
+                    .execution_options(yield_per=256)
+                )
+                # Stream list-shaped reads so large limits buffer at most one
+                # 256-row batch of ORM objects instead of the whole result.
+                characters = []
+                async for c in (await sess.stream(q)).scalars():
+                    characters.append({"id": c.id, "name": c.name, "attrs": c.attrs})
+                return ("characters", characters)
+
+            if kind == "interaction_log":
+                limit = max(1, int(params.get("limit", 100)))
+                # Filter server-side via json_extract so SQLite returns only
+                # matching rows instead of over-fetching and filtering here.
+                # Each lambda chain (with/without filters) is its own cache key.
+                q = lambda_stmt(
+                    lambda: select(models.InteractionLog)
+                    .where(models.InteractionLog.campaign_id == cid)
+                    .order_by(models.InteractionLog.id.desc())
+                    .limit(limit)
+                    .execution_options(yield_per=256)
+                )
+                session_id = str(params.get("session_id") or "").strip()
+                if session_id:
+                    q += lambda s: s.where(
+                        func.json_extract(models.InteractionLog.entry, "$.session_id") == session_id
                     )
-                    rows = (await sess.execute(q)).scalars().all()
-                    entries = [r.entry for r in reversed(rows)]
-                    session_id = str(params.get("session_id") or "").strip()
-                    if session_id:
-                        entries = [
-                            e
-                            for e in entries
-                            if isinstance(e, dict) and str(e.get("session_id") or "").strip() == session_id
-                        ]
-                    player_id = str(params.get("player_id") or "").strip()
-                    if player_id:
-                        entries = [
-                            e
-                            for e in entries
-                            if isinstance(e, dict) and str(e.get("player_id") or "").strip() == player_id
-                        ]
-                    out["interaction_log"] = entries[-max(1, limit) :]
-
-                elif kind == "delayed_events":
-                    limit = int(params.get("limit", 100))
-                    q = (
-                        select(models.DelayedEvent)
-                        .where(models.DelayedEvent.campaign_id == ctx.campaign_id)
-                        .limit(limit)
+                player_id = str(params.get("player_id") or "").strip()
+                if player_id:
+                    q += lambda s: s.where(
+                        func.json_extract(models.InteractionLog.entry, "$.player_id") == player_id
                     )
-                    rows = (await sess.execute(q)).scalars().all()
-                    out["delayed_events"] = [
+                entries = []
+                async for r in (await sess.stream(q)).scalars():
+                    entries.append(r.entry)
+                entries.reverse()
+                return ("interaction_log", entries)
+
+            if kind == "delayed_events":
+                limit = int(params.get("limit", 100))
+                q = lambda_stmt(
+                    lambda: select(models.DelayedEvent)
+                    .where(models.DelayedEvent.campaign_id == cid)
+                    .limit(limit)
+                    .execution_options(yield_per=256)
+                )
+                events = []
+                async for e in (await sess.stream(q)).scalars():
+                    events.append(
                         {
                             "id": e.id,
                             "due_at": e.due_at.isoformat(),
@@ -241,35 +335,60 @@ class WorldStateStore:
                             "last_error": e.last_error,
                             "payload": e.payload,
                         }
-                        for e in rows
-                    ]
-                else:
-                    out.setdefault("unknown_reads", []).append({"kind": kind, "params": params})
+                    )
+                return ("delayed_events", events)
 
-        return out
+            return ("unknown_reads", {"kind": kind, "params": params})
 
     async def apply_writes(self, ctx: TurnContext, writes: list[StateWriteSpec]) -> None:
-        await self.ensure_schema()
-        async with self._db.sessionmaker()() as sess:
+        if not self._schema_ready:
+            await self.ensure_schema()
+
+        # Batch contiguous runs of same-table inserts into one executemany each
+        # while keeping their relative order against updates/deletes, so
+        # order-sensitive sequences (e.g. delete-then-reinsert of a PK) behave
+        # exactly like the per-row path did.
+        async with self._sessionmaker() as sess:
             async with sess.begin():
+                pending_model: type | None = None
+                pending_rows: list[dict[str, Any]] = []
+
+                async def _flush() -> None:
+                    nonlocal pending_model
+                    if pending_rows:
+                        await sess.execute(insert(pending_model), list(pending_rows))
+                        pending_rows.clear()
+                    pending_model = None
+
+                async def _buffer(model_cls: type, row: dict[str, Any]) -> None:
+                    nonlocal pending_model
+                    if pending_model is not model_cls:
+                        await _flush()
+                        pending_model = model_cls
+                    pending_rows.append(row)
+
                 for spec in writes:
                     kind = spec.kind
                     p = spec.params
 
                     if kind == "append_log":
-                        sess.add(models.InteractionLog(campaign_id=ctx.campaign_id, entry=p["entry"]))
+                        await _buffer(
+                            models.InteractionLog,
+                            {"campaign_id": ctx.campaign_id, "entry": p["entry"]},
+                        )
                         continue
 
                     if kind == "schedule_delayed_event":
-                        sess.add(
-                            models.DelayedEvent(
-                                campaign_id=ctx.campaign_id,
-                                due_at=p["due_at"],
-                                payload=p["payload"],
-                                status=p.get("status", "pending"),
-                                attempts=int(p.get("attempts", 0)),
-                                last_error=p.get("last_error"),
-                            )
+                        await _buffer(
+                            models.DelayedEvent,
+                            {
+                                "campaign_id": ctx.campaign_id,
+                                "due_at": p["due_at"],
+                                "payload": p["payload"],
+                                "status": p.get("status", "pending"),
+                                "attempts": int(p.get("attempts", 0)),
+                                "last_error": p.get("last_error"),
+                            },
                         )
                         continue
 
@@ -283,8 +402,11 @@ class WorldStateStore:
                     if op == "insert":
                         obj = dict(p.get("obj") or {})
                         obj["campaign_id"] = ctx.campaign_id
-                        sess.add(model_cls(**obj))
-                    elif op == "update":
+                        await _buffer(model_cls, obj)
+                        continue
+
+                    await _flush()
+                    if op == "update":
                         pk = p.get("id")
                         fields = p.get("fields") or {}
                         if not pk:
@@ -300,6 +422,8 @@ class WorldStateStore:
                         if pk:
                             await sess.execute(delete(model_cls).where(model_cls.id == pk))
 
+                await _flush()
+
     async def schedule_delayed_event(self, ctx: TurnContext, ev: dict) -> None:
         # Compatibility shim
         await self.apply_writes(
@@ -317,17 +441,17 @@ class WorldStateStore:
 
     async def clear_interaction_log(self, ctx: TurnContext) -> int:
         """Delete all interaction_log entries for a campaign. Returns number of rows deleted."""
-        await self.ensure_schema()
-        async with self._db.sessionmaker()() as sess:
+        if not self._schema_ready:
+            await self.ensure_schema()
+        async with self._sessionmaker() as sess:
             async with sess.begin():
-                q = select(func.count()).select_from(models.InteractionLog).where(
-                    models.InteractionLog.campaign_id == ctx.campaign_id
-                )
-                n = int((await sess.execute(q)).scalar() or 0)
-                await sess.execute(
-                    delete(models.InteractionLog).where(models.InteractionLog.campaign_id == ctx.campaign_id)
+                # Single DELETE; rowcount replaces the prior COUNT round-trip.
+                result = await sess.execute(
+                    delete(models.InteractionLog).where(
+                        models.InteractionLog.campaign_id == ctx.campaign_id
+                    )
                 )
-                return n
+                return int(result.rowcount or 0)
 
     async def clear_interaction_log_filtered(
         self,
@@ -342,47 +466,43 @@ class WorldStateStore:
         if not session_id and not player_id:
             return await self.clear_interaction_log(ctx)
 
-        await self.ensure_schema()
-        async with self._db.sessionmaker()() as sess:
+        if not self._schema_ready:
+            await self.ensure_schema()
+        async with self._sessionmaker() as sess:
             async with sess.begin():
-                q = (
-                    select(models.InteractionLog)
-                    .where(models.InteractionLog.campaign_id == ctx.campaign_id)
-                    .order_by(models.InteractionLog.id.desc())
+                # One DELETE with json_extract filters; no row materialization.
+                stmt = delete(models.InteractionLog).where(
+                    models.InteractionLog.campaign_id == ctx.campaign_id
                 )
-                rows = (await sess.execute(q)).scalars().all()
-                ids: list[int] = []
-                for r in rows:
-                    e = r.entry if isinstance(r.entry, dict) else {}
-                    if session_id and str(e.get("session_id") or "").strip() != session_id:
-                        continue
-                    if player_id and str(e.get("player_id") or "").strip() != player_id:
-                        continue
-                    ids.append(int(r.id))
-
-                if not ids:
-                    return 0
-                await sess.execute(delete(models.InteractionLog).where(models.InteractionLog.id.in_(ids)))
-                return len(ids)
+                if session_id:
+                    stmt = stmt.where(
+                        func.json_extract(models.InteractionLog.entry, "$.session_id") == session_id
+                    )
+                if player_id:
+                    stmt = stmt.where(
+                        func.json_extract(models.InteractionLog.entry, "$.player_id") == player_id
+                    )
+                result = await sess.execute(stmt)
+                return int(result.rowcount or 0)
 
     async def clear_delayed_events(self, ctx: TurnContext) -> int:
         """Delete all delayed_events for a campaign. Returns number of rows deleted."""
-        await self.ensure_schema()
-        async with self._db.sessionmaker()() as sess:
+        if not self._schema_ready:
+            await self.ensure_schema()
+        async with self._sessionmaker() as sess:
             async with sess.begin():
-                q = select(func.count()).select_from(models.DelayedEvent).where(
-                    models.DelayedEvent.campaign_id == ctx.campaign_id
-                )
-                n = int((await sess.execute(q)).scalar() or 0)
-                await sess.execute(
-                    delete(models.DelayedEvent).where(models.DelayedEvent.campaign_id == ctx.campaign_id)
+                result = await sess.execute(
+                    delete(models.DelayedEvent).where(
+                        models.DelayedEvent.campaign_id == ctx.campaign_id
+                    )
                 )
-                return n
+                return int(result.rowcount or 0)
 
     async def latest_campaign_id(self) -> str | None:
         """Best-effort: campaign with the most recent interaction_log entry (by max id)."""
-        await self.ensure_schema()
-        async with self._db.sessionmaker()() as sess:
+        if not self._schema_ready:
+            await self.ensure_schema()
+        async with self._sessionmaker() as sess:
             q = (
                 select(
                     models.InteractionLog.campaign_id,
@@ -398,10 +518,9 @@ class WorldStateStore:
             return str(row[0])
 
 
-def _model_for_name(name: str | None):
-    if not name:
-        return None
-    return {
+# Built once at import; read-only view keeps callers from mutating the table.
+_MODELS = MappingProxyType(
+    {
         "campaigns": models.Campaign,
         "players": models.Player,
         "characters": models.Character,
@@ -411,4 +530,11 @@ def _model_for_name(name: str | None):
         "factions": models.Faction,
         "inventory_items": models.InventoryItem,
         "timeline_events": models.TimelineEvent,
-    }.get(name)
+    }
+)
+
+
+def _model_for_name(name: str | None):
+    if not name:
+        return None
+    return _MODELS.get(name)
@@ -9,37 +9,43 @@ def _read_checksums(path: Path) -> list[tuple[str, str]]:
     rows: list[tuple[str, str]] = []
     if not path.exists():
         return rows
-    for raw in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        parts = line.split(maxsplit=1)
-        if len(parts) != 2:
-            continue
-        rows.append((parts[0], parts[1]))
+    # Stream line by line; partition returns a fixed 3-tuple, no list per row.
+    with path.open("r", encoding="utf-8", errors="ignore") as fh:
+        for raw in fh:
+            line = raw.strip()
+            if not line:
+                continue
+            digest, sep, name = line.partition(" ")
+            if not sep or not name.strip():
+                continue
+            rows.append((digest, name.lstrip()))
     return rows
 
 
+_PLATFORM_TAGS = (("linux-", "Linux"), ("windows-", "Windows"), ("macos-", "macOS"))
+
+
 def _platform_label(filename: str) -> str:
     lower = filename.lower()
-    if "linux-" in lower:
-        return "Linux"
-    if "windows-" in lower:
-        return "Windows"
-    if "macos-" in lower:
-        return "macOS"
+    for tag, label in _PLATFORM_TAGS:
+        if tag in lower:
+            return label
     return "Other"
 
 
 def _render(version: str, checksums: list[tuple[str, str]]) -> str:
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-    archives = [(h, f) for (h, f) in checksums if f.endswith(".zip") or f.endswith(".tar.gz")]
+    archives = [
+        (h, f)
+        for (h, f) in checksums
+        if f.endswith(".zip") or f.endswith(".tar.gz") or f.endswith(".tar.zst")
+    ]
 
     by_platform: dict[str, list[str]] = {"Linux": [], "Windows": [], "macOS": [], "Other": []}
     for _, name in archives:
         by_platform[_platform_label(name)].append(name)
-    for key in by_platform:
-        by_platform[key].sort()
+    for files in by_platform.values():
+        files.sort()
 
     lines: list[str] = []
     lines.append(f"# GMv3 {version}")
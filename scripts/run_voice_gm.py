@@ -6,6 +6,7 @@ import base64
 import json
 import os
 import re
+import select
 import signal
 import socket
 import subprocess
@@ -115,6 +116,7 @@ def _build_llm_provider(*, settings_store: SettingsStore) -> Any:
 
 
 _PORT_PID_RE = re.compile(r"\bpid=(\d+)\b")
+_FUSER_PID_RE = re.compile(r"\b\d+\b")
 
 
 def _is_truthy_env(name: str, default: str = "1") -> bool:
@@ -136,11 +138,9 @@ def _list_listening_pids_for_port(port: int) -> set[int]:
             text=True,
         )
         if out.stdout:
-            for m in _PORT_PID_RE.finditer(out.stdout):
-                try:
-                    pids.add(int(m.group(1)))
-                except Exception:
-                    pass
+            # One bulk findall; the pattern only matches digits, so the int()
+            # calls cannot fail.
+            pids.update(map(int, _PORT_PID_RE.findall(out.stdout)))
     except Exception:
         pass
 
@@ -177,11 +177,7 @@ def _list_listening_pids_for_port(port: int) -> set[int]:
             text=True,
         )
         text = " ".join([out.stdout or "", out.stderr or ""])
-        for token in re.findall(r"\b\d+\b", text):
-            try:
-                pids.add(int(token))
-            except Exception:
-                pass
+        pids.update(map(int, _FUSER_PID_RE.findall(text)))
     except Exception:
         pass
 
@@ -202,6 +198,33 @@ def _pid_exists(pid: int) -> bool:
         return False
 
 
+def _wait_pid_gone(pid: int, timeout_secs: float) -> bool:
+    # pidfd (Linux >= 5.3): the kernel wakes us the moment the process exits,
+    # instead of re-probing with os.kill every 50 ms.
+    try:
+        fd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return True
+    except (AttributeError, OSError):
+        pass  # non-Linux or old kernel; fall back to polling below
+    else:
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            if poller.poll(int(timeout_secs * 1000)):
+                return True
+        finally:
+            os.close(fd)
+        return not _pid_exists(pid)
+
+    deadline = time.monotonic() + timeout_secs
+    while time.monotonic() < deadline:
+        if not _pid_exists(pid):
+            return True
+        time.sleep(0.05)
+    return not _pid_exists(pid)
+
+
 def _terminate_pid(pid: int, *, term_timeout_secs: float = 1.5) -> bool:
     if pid <= 0:
         return False
@@ -214,11 +237,8 @@ def _terminate_pid(pid: int, *, term_timeout_secs: float = 1.5) -> bool:
     except Exception:
         return False
 
-    deadline = time.monotonic() + term_timeout_secs
-    while time.monotonic() < deadline:
-        if not _pid_exists(pid):
-            return True
-        time.sleep(0.05)
+    if _wait_pid_gone(pid, term_timeout_secs):
+        return True
 
     try:
         os.kill(pid, signal.SIGKILL)
@@ -229,12 +249,7 @@ def _terminate_pid(pid: int, *, term_timeout_secs: float = 1.5) -> bool:
     except Exception:
         return False
 
-    deadline = time.monotonic() + 1.0
-    while time.monotonic() < deadline:
-        if not _pid_exists(pid):
-            return True
-        time.sleep(0.05)
-    return not _pid_exists(pid)
+    return _wait_pid_gone(pid, 1.0)
 
 
 def _free_port_by_terminating_listeners(port: int, *, label: str, protected_pids: set[int]) -> list[int]:
@@ -1867,6 +1882,8 @@ def main():
     stored = settings_store.get()
 
     state = WorldStateStore(db_path=root / "data" / "world.sqlite")
+    # Create tables/indexes once up front so turn handling never awaits schema setup.
+    asyncio.run(state.startup())
     logger = EventLogger(path=root / "data" / "events.jsonl")
 
     # Knowledge is optional; install `.[knowledge]` and run Qdrant to enable.
@@ -0,0 +1,17 @@
+@echo off
+setlocal
+cd /d "%~dp0"
+echo Starting GMv3 Pro Windows installer...
+powershell -NoLogo -NoProfile -ExecutionPolicy Bypass -File "%~dp0install.ps1"
+set EXIT_CODE=%ERRORLEVEL%
+if not "%EXIT_CODE%"=="0" (
+  echo.
+  echo Installer failed with code %EXIT_CODE%.
+  echo If needed, right-click install.ps1 and run it with PowerShell.
+  pause
+  endlocal & exit /b %EXIT_CODE%
+)
+echo.
+echo Installer finished.
+pause
+endlocal & exit /b 0
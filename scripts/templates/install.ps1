@@ -0,0 +1,119 @@
+$ErrorActionPreference = "Stop"
+$src = Split-Path -Parent $MyInvocation.MyCommand.Path
+$defaultTarget = Join-Path $env:USERPROFILE "GMv3Pro"
+$target = $defaultTarget
+
+Write-Host "GMv3 Pro first-time installer (Windows)"
+Write-Host "Default install path: $defaultTarget"
+$inputTarget = Read-Host "Install path (press Enter for default)"
+if (-not [string]::IsNullOrWhiteSpace($inputTarget)) {
+  $target = $inputTarget.Trim()
+}
+
+New-Item -ItemType Directory -Force -Path $target | Out-Null
+Copy-Item -Recurse -Force (Join-Path $src "app") $target
+Copy-Item -Force (Join-Path $src ".env.example") $target
+Copy-Item -Force (Join-Path $src "run.bat") $target
+Copy-Item -Force (Join-Path $src "install.ps1") $target
+if (Test-Path (Join-Path $src "install.bat")) {
+  Copy-Item -Force (Join-Path $src "install.bat") $target
+}
+
+$envPath = Join-Path $target ".env"
+if (-not (Test-Path $envPath)) {
+  Copy-Item -Force (Join-Path $target ".env.example") $envPath
+}
+
+function Set-EnvValue {
+  param(
+    [string]$Path,
+    [string]$Key,
+    [string]$Value
+  )
+  $lines = @()
+  if (Test-Path $Path) {
+    $lines = Get-Content -Path $Path
+  }
+  $prefix = [regex]::Escape($Key) + "="
+  $found = $false
+  for ($i = 0; $i -lt $lines.Count; $i++) {
+    if ($lines[$i] -match "^$prefix") {
+      $lines[$i] = "$Key=$Value"
+      $found = $true
+    }
+  }
+  if (-not $found) {
+    $lines += "$Key=$Value"
+  }
+  Set-Content -Path $Path -Value $lines -Encoding UTF8
+}
+
+Write-Host ""
+Write-Host "Choose LLM auth mode:"
+Write-Host "  1) OpenAI API key (GM_LLM_PROVIDER=openai)"
+Write-Host "  2) ChatGPT Codex login (GM_LLM_PROVIDER=codex_chatgpt)"
+$authChoice = Read-Host "Select [1/2] (default 1)"
+$authMode = "openai"
+if ($authChoice -eq "2") {
+  $authMode = "codex_chatgpt"
+}
+Set-EnvValue -Path $envPath -Key "GM_LLM_PROVIDER" -Value $authMode
+
+Write-Host ""
+$codexBin = Join-Path $target "app\codex\codex.exe"
+$codexPathDir = Join-Path $target "app\path"
+$codexHome = Join-Path $target ".codex-home"
+New-Item -ItemType Directory -Force -Path $codexHome | Out-Null
+$env:CODEX_HOME = $codexHome
+if (Test-Path $codexPathDir) {
+  $env:PATH = "$codexPathDir;$env:PATH"
+}
+if (Test-Path $codexBin) {
+  $env:GM_CODEX_BIN = $codexBin
+}
+
+Write-Host ""
+if ($authMode -eq "openai") {
+  Write-Host "Set OPENAI_API_KEY in: $envPath"
+} else {
+  Write-Host "ChatGPT Codex auth mode selected."
+  Write-Host "Bundled Codex binary: $codexBin"
+  Write-Host "Auth storage (CODEX_HOME): $codexHome"
+}
+$openEnv = Read-Host "Open .env in Notepad now? [Y/n]"
+if (
+  [string]::IsNullOrWhiteSpace($openEnv) -or
+  $openEnv.Trim().ToLower() -eq "y" -or
+  $openEnv.Trim().ToLower() -eq "yes"
+) {
+  notepad $envPath
+}
+
+if ($authMode -eq "codex_chatgpt") {
+  $runLogin = Read-Host "Run ChatGPT login now (opens browser)? [Y/n]"
+  $runLoginNorm = if ([string]::IsNullOrWhiteSpace($runLogin)) { "y" } else { $runLogin.Trim().ToLower() }
+  if ($runLoginNorm -eq "y" -or $runLoginNorm -eq "yes") {
+    if (Test-Path $codexBin) {
+      & $codexBin login
+      if ($LASTEXITCODE -ne 0) {
+        Write-Warning "Codex login failed. Retry later with: $codexBin login"
+      }
+    } else {
+      Write-Warning "Bundled Codex binary not found: $codexBin"
+    }
+  }
+}
+
+Write-Host ""
+Write-Host "Installed to: $target"
+Write-Host "Next steps:"
+Write-Host "  1) Review .env and add provider keys"
+Write-Host "  2) Start server: .\run.bat"
+Write-Host "  3) Open: http://localhost:8000"
+Write-Host "  4) Re-run setup later: .\install.bat"
+
+$startNow = Read-Host "Start now? [y/N]"
+if (-not [string]::IsNullOrWhiteSpace($startNow) -and $startNow.Trim().ToLower() -eq "y") {
+  Set-Location $target
+  & .\run.bat
+}
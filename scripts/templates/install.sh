@@ -0,0 +1,117 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+SRC_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+DEFAULT_TARGET="${HOME}/.local/GMv3Pro"
+TARGET_DIR="${DEFAULT_TARGET}"
+
+if [[ -t 0 ]]; then
+  echo "GMv3 Pro first-time installer (Linux/macOS)"
+  echo "Default install path: ${DEFAULT_TARGET}"
+  read -r -p "Install path (press Enter for default): " INPUT_TARGET
+  if [[ -n "${INPUT_TARGET:-}" ]]; then
+    TARGET_DIR="${INPUT_TARGET}"
+  fi
+fi
+
+mkdir -p "$TARGET_DIR"
+cp -a "$SRC_DIR/app" "$TARGET_DIR/"
+cp -a "$SRC_DIR/.env.example" "$TARGET_DIR/"
+cp -a "$SRC_DIR/run.sh" "$TARGET_DIR/"
+chmod +x "$TARGET_DIR/run.sh"
+
+ENV_PATH="$TARGET_DIR/.env"
+if [[ ! -f "$ENV_PATH" ]]; then
+  cp "$TARGET_DIR/.env.example" "$ENV_PATH"
+fi
+CODEX_BIN="$TARGET_DIR/app/codex/codex"
+CODEX_PATH_DIR="$TARGET_DIR/app/path"
+CODEX_HOME_DIR="$TARGET_DIR/.codex-home"
+mkdir -p "$CODEX_HOME_DIR"
+
+set_env_value() {
+  local key="$1"
+  local val="$2"
+  local file="$3"
+  local tmp
+  tmp="$(mktemp)"
+  awk -v k="$key" -v v="$val" '
+    BEGIN { done=0 }
+    $0 ~ ("^" k "=") { print k "=" v; done=1; next }
+    { print }
+    END { if (!done) print k "=" v }
+  ' "$file" > "$tmp"
+  mv "$tmp" "$file"
+}
+
+AUTH_MODE="openai"
+if [[ -t 0 ]]; then
+  echo
+  echo "Choose LLM auth mode:"
+  echo "  1) OpenAI API key (GM_LLM_PROVIDER=openai)"
+  echo "  2) ChatGPT Codex login (GM_LLM_PROVIDER=codex_chatgpt)"
+  read -r -p "Select [1/2] (default 1): " AUTH_CHOICE
+  if [[ "${AUTH_CHOICE:-1}" == "2" ]]; then
+    AUTH_MODE="codex_chatgpt"
+  fi
+fi
+set_env_value "GM_LLM_PROVIDER" "$AUTH_MODE" "$ENV_PATH"
+
+if [[ -t 0 ]]; then
+  echo
+  if [[ "$AUTH_MODE" == "openai" ]]; then
+    echo "Set OPENAI_API_KEY in: $ENV_PATH"
+  else
+    echo "ChatGPT Codex auth mode selected."
+    echo "Bundled Codex binary: $CODEX_BIN"
+    echo "Auth storage (CODEX_HOME): $CODEX_HOME_DIR"
+  fi
+  read -r -p "Open .env now? [Y/n]: " OPEN_ENV
+  if [[ -z "${OPEN_ENV:-}" || "${OPEN_ENV,,}" == "y" || "${OPEN_ENV,,}" == "yes" ]]; then
+    if [[ -n "${EDITOR:-}" ]] && command -v "${EDITOR%% *}" >/dev/null 2>&1; then
+      "${EDITOR%% *}" "$ENV_PATH" || true
+    elif command -v nano >/dev/null 2>&1; then
+      nano "$ENV_PATH"
+    elif command -v vi >/dev/null 2>&1; then
+      vi "$ENV_PATH"
+    else
+      echo "No terminal editor found. Edit manually: $ENV_PATH"
+    fi
+  fi
+
+  if [[ "$AUTH_MODE" == "codex_chatgpt" ]]; then
+    echo
+    read -r -p "Run ChatGPT login now (opens browser)? [Y/n]: " RUN_CODEX_LOGIN
+    if [[ -z "${RUN_CODEX_LOGIN:-}" || "${RUN_CODEX_LOGIN,,}" == "y" || "${RUN_CODEX_LOGIN,,}" == "yes" ]]; then
+      if [[ -x "$CODEX_BIN" ]]; then
+        export CODEX_HOME="$CODEX_HOME_DIR"
+        export GM_CODEX_BIN="$CODEX_BIN"
+        if [[ -d "$CODEX_PATH_DIR" ]]; then
+          export PATH="$CODEX_PATH_DIR:$PATH"
+        fi
+        "$CODEX_BIN" login || echo "Codex login failed; you can retry later with: $CODEX_BIN login"
+      else
+        echo "Bundled Codex binary not found: $CODEX_BIN"
+      fi
+    fi
+  fi
+fi
+
+cat <<MSG
+Installed to: $TARGET_DIR
+
+Next steps:
+  1) cd "$TARGET_DIR"
+  2) Review .env and add provider keys
+  3) Start server: ./run.sh
+  4) Open: http://localhost:8000
+MSG
+
+if [[ -t 0 ]]; then
+  echo
+  read -r -p "Start now? [y/N]: " START_NOW
+  if [[ "${START_NOW:-n}" == "y" || "${START_NOW:-n}" == "Y" ]]; then
+    cd "$TARGET_DIR"
+    exec ./run.sh
+  fi
+fi
@@ -0,0 +1,24 @@
+@echo off
+setlocal
+cd /d "%~dp0"
+if not exist ".env" (
+  copy /Y ".env.example" ".env" >nul
+  echo Created .env from template. Fill API keys and rerun.
+)
+set "CODEX_HOME=%~dp0.codex-home"
+if not exist "%CODEX_HOME%" mkdir "%CODEX_HOME%" >nul 2>&1
+set "GM_CODEX_BIN=%~dp0app\codex\codex.exe"
+if exist "%~dp0app\path" set "PATH=%~dp0app\path;%PATH%"
+if not exist "app\GMv3Server.exe" (
+  echo ERROR: app\GMv3Server.exe was not found.
+  pause
+  endlocal & exit /b 1
+)
+"app\GMv3Server.exe" --mode voice-ws
+set EXIT_CODE=%ERRORLEVEL%
+if not "%EXIT_CODE%"=="0" (
+  echo.
+  echo Server exited with code %EXIT_CODE%.
+  pause
+)
+endlocal & exit /b %EXIT_CODE%
@@ -0,0 +1,20 @@
+#!/usr/bin/env bash
+set -euo pipefail
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+cd "$ROOT_DIR"
+if [[ ! -f .env ]]; then
+  cp .env.example .env
+  echo "Created .env from template. Fill API keys and rerun."
+fi
+CODEX_BIN="$ROOT_DIR/app/codex/codex"
+CODEX_PATH_DIR="$ROOT_DIR/app/path"
+CODEX_HOME_DIR="$ROOT_DIR/.codex-home"
+mkdir -p "$CODEX_HOME_DIR"
+export CODEX_HOME="$CODEX_HOME_DIR"
+if [[ -x "$CODEX_BIN" ]]; then
+  export GM_CODEX_BIN="$CODEX_BIN"
+  if [[ -d "$CODEX_PATH_DIR" ]]; then
+    export PATH="$CODEX_PATH_DIR:$PATH"
+  fi
+fi
+exec "$ROOT_DIR/app/GMv3Server" --mode voice-ws